@@ -1,60 +1,104 @@
-import json
+import os
+import re
+import csv
+import mmap
+import orjson
 import dateparser
-import pandas as pd
 from uuid import uuid4
 from pathlib import Path
+from dateutil import parser
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import shutil
-from schema import Instrument, Document, DocumentText, DocumentMetadata
+from schema import Instrument, encoder
+
+# The formats corpus dates actually appear in. `dateparser` is general-purpose and extremely
+# slow (locale detection, scores of regex tries), so these are tried with `strptime` first
+# and `dateparser` is kept only as a fallback for the rare stragglers.
+DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%d %B %Y', '%d %b %Y')
+
+def parse_date(date):
+    # Truncate to a `date`: `Document.effective_date` is typed `datetime.date`, so encoding a full datetime would produce records the validating decoder rejects.
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date, fmt).date()
+        except ValueError:
+            pass
+
+    parsed = dateparser.parse(date)
+
+    return parsed.date() if parsed else None
+
+# Lookup tables hoisted to module scope so per-row calls neither rebuild a dict nor walk branches.
+INSTRUMENTS = {
+    'primary_legislation': Instrument.Legislation,
+    'secondary_legislation': Instrument.Regulation,
+    'decision': Instrument.CaseLaw,
+}
+
+JURISDICTIONS_NORMALISED = {
+    "south_australia": "J0105",
+    "western_australia": "J0105",
+    "tasmania": "J0106",
+    "new_south_wales": "J0103",
+    "commonwealth": "J0100",
+    "queensland": "J0102",
+    "victoria": "J0101",
+    "norfolk_island": "J0109"
+}
 
 def type_to_instrument(x):
-    if x == 'primary_legislation':
-        return Instrument.Legislation
-    if x == 'secondary_legislation':
-        return Instrument.Regulation
-    if x == 'decision':
-        return Instrument.CaseLaw
+    return INSTRUMENTS.get(x)
 
 def jurisdiction_normalise(x):
-    return {
-        "south_australia": "J0105",
-        "western_australia": "J0105",
-        "tasmania": "J0106",
-        "new_south_wales": "J0103",
-        "commonwealth": "J0100",
-        "queensland": "J0102",
-        "victoria": "J0101",
-        "norfolk_island": "J0109"
-    }[x]
+    return JURISDICTIONS_NORMALISED[x]
+
+FEDERAL_COURT_MAPPINGS = {
+    "federal_court_of_australia:fca/single": 'C0100001',
+    "federal_court_of_australia:fca/full": "C0100001",
+    "federal_court_of_australia:irc": "C0100002",
+    'federal_court_of_australia:tribunals/acompt': "C0100003",
+    "federal_court_of_australia:nfsc": "C0109001",
+    "federal_court_of_australia:tribunals/acopyt": "C0100004",
+    "federal_court_of_australia:tribunals/fpdt": "C0100005",
+    "federal_court_of_australia:tribunals/atpt": "C0100006",
+    "federal_court_of_australia:tribunals/adfdat": "C0100007"
+}
+
+# One compiled alternation replaces nine Python-level substring scans per row.
+FEDERAL_COURT_RE = re.compile('|'.join(map(re.escape, FEDERAL_COURT_MAPPINGS)))
 
 def federal_court_mappings(x):
-    mapping = {
-        "federal_court_of_australia:fca/single": 'C0100001',
-        "federal_court_of_australia:fca/full": "C0100001",
-        "federal_court_of_australia:irc": "C0100002",
-        'federal_court_of_australia:tribunals/acompt': "C0100003",
-        "federal_court_of_australia:nfsc": "C0109001",
-        "federal_court_of_australia:tribunals/acopyt": "C0100004",
-        "federal_court_of_australia:tribunals/fpdt": "C0100005",
-        "federal_court_of_australia:tribunals/atpt": "C0100006",
-        "federal_court_of_australia:tribunals/adfdat": "C0100007"
-    }
-    for key in mapping.keys():
-        if key in x:
-            return mapping[key]
+    match = FEDERAL_COURT_RE.search(x)
+    if match:
+        return FEDERAL_COURT_MAPPINGS[match.group(0)]
     print(x)
     raise ValueError
 
 
-courts = pd.read_csv("./data/courts.csv").set_index("id")
-jurisdiction = pd.read_csv("./data/jurisdiction.csv").set_index("id")
+# The tables are tiny, so they are read with the stdlib csv module straight into plain
+# dicts, sparing every invocation of this script the pandas import and CSV machinery.
+with open("./data/courts.csv") as _courts_file:
+    COURTS = {row["id"]: row["full_name"] for row in csv.DictReader(_courts_file)}
+
+with open("./data/jurisdiction.csv") as _jurisdiction_file:
+    JURISDICTIONS = {
+        row["id"]: {
+            "name": row["name"],
+            "country": row["country"],
+            # Precompute the empty-string -> None substitution so per-row lookups need no checks.
+            "province": row["province"] or None,
+        }
+        for row in csv.DictReader(_jurisdiction_file)
+    }
 
 def get_court_given_id(id):
     if id:
-        return courts.loc[id, "full_name"]
+        return COURTS.get(id)
     return None
 
 def get_jurisdiction_given_id(id):
-    return jurisdiction.loc[id, ["name", "country", "province"]].to_dict()
+    return JURISDICTIONS[id]
 
 def process(row):
     court_id = None
@@ -63,12 +107,14 @@ def process(row):
             court_id = federal_court_mappings(row["version_id"])
         if row["source"] == "high_court_of_australia":
             court_id = "C0100008"
-    date = dateparser.parse(row["date"]) if row["date"] else None
-    data = dict(
+    date = parse_date(row["date"]) if row["date"] else None
+    # NOTE `process` builds plain dicts rather than model instances as the models were only
+    # ever used to call the encoder, and instantiating them cost ~4 object allocations per row.
+    doc = dict(
         id=row['version_id'],
         jurisdiction_id=jurisdiction_normalise(row["jurisdiction"]),
         court_id=court_id,
-        instrument=type_to_instrument(row["type"]),
+        instrument=type_to_instrument(row["type"]).value,
         instrument_subtype=None,
         title=row["citation"],
         headnotes=None,
@@ -86,66 +132,107 @@ def process(row):
         citation=row["citation"],
         year=date.year if date else None,
         effective_date=date,
-        date_scraped=row["when_scraped"]
+        date_scraped=parser.parse(row["when_scraped"])
     )
-    doc = Document(**data)
-    jurisdiction = get_jurisdiction_given_id(doc.jurisdiction_id)
-    metadata = DocumentMetadata(
-        document_id=doc.id,
-        document_title=doc.title,
-        document_citation=doc.citation,
-        document_source_url=str(doc.source_url),
-        document_pdf_url=str(doc.pdf_url),
+    jurisdiction = get_jurisdiction_given_id(doc["jurisdiction_id"])
+    metadata = dict(
+        document_id=doc["id"],
+        document_title=doc["title"],
+        document_citation=doc["citation"],
+        document_source_url=doc["source_url"],
+        document_pdf_url=doc["pdf_url"],
         section_id=None,
         section_title=None,
         section_citation=None,
         opinion_id=None,
         opinion_author=None,
         opinion_type=None,
-        court=get_court_given_id(doc.court_id),
-        instrument=doc.instrument,
-        instrument_subtype=doc.instrument_subtype,
-        jurisdiction_id=doc.jurisdiction_id,
+        court=get_court_given_id(doc["court_id"]),
+        instrument=doc["instrument"],
+        instrument_subtype=doc["instrument_subtype"],
+        jurisdiction_id=doc["jurisdiction_id"],
         jurisdiction=jurisdiction["name"],
         country=jurisdiction["country"],
-        province=None if pd.isna(jurisdiction["province"]) else jurisdiction["province"],
+        province=jurisdiction["province"],
         other=None,
     )
-    text = DocumentText(
-        id=doc.id,
+    text = dict(
+        id=doc["id"],
         text=row["text"],
         metadata=metadata
     )
     return doc, text
 
 def write_batch(dir: Path, batch):
-    with open(dir.joinpath(uuid4().hex + ".jsonl"), 'w') as f:
-        for item in batch:
-            f.write(item.json() + "\n")
+    # Join the encoded batch into one buffer so the batch is written with a single syscall
+    # rather than two writes per item.
+    with open(dir.joinpath(uuid4().hex + ".jsonl"), 'wb', buffering=1 << 20) as f:
+        f.write(b"".join([encoder(item) + b"\n" for item in batch]))
+
+CORPUS_PATH = './data/corpus.jsonl'
+
+# The size of the byte ranges the corpus is carved into for the workers, before rounding up to the next line boundary.
+CHUNK_SIZE = 64 * 1024 * 1024
+
+def chunk_bounds(path, chunk_size=CHUNK_SIZE):
+    # Carve the corpus into contiguous byte ranges that start and end on line boundaries
+    # by bisecting a memory map on newlines near each chunk_size multiple.
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+
+        while start < size:
+            end = mm.find(b'\n', min(start + chunk_size, size - 1))
+            end = size if end == -1 else end + 1
+
+            yield start, end
+
+            start = end
+
+def process_chunk(bounds):
+    # Memory-map the corpus in the worker and process the lines of the assigned byte
+    # range, skipping Python-level readline buffering entirely.
+    start, end = bounds
+
+    with open(CORPUS_PATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return process_batch(mm[start:end].splitlines())
+
+def process_batch(lines):
+    # Process a batch of raw corpus lines in a worker, returning the encoded document
+    # records as a single bytes object alongside the text dicts for `write_batch`.
+    doc_records = []
+    texts = []
+
+    for line in lines:
+        row = orjson.loads(line)
+        if row['type'] in ['bill']:
+            continue
+        doc, text = process(row)
+
+        doc_records.append(encoder(doc))
+        doc_records.append(b"\n")
+        texts.append(text)
+
+    return b"".join(doc_records), texts
 
 def main():
-    with open('./data/document_records.jsonl', 'w') as document_file:
-        text_batch = []
-        _dir = Path('./data/documents')
-        if _dir.exists():
-           shutil.rmtree(_dir)
-        _dir.mkdir()
-
-        with open('./data/corpus.jsonl', 'r') as f:
-            for line in f.readlines():
-                row = json.loads(line)
-                if row['type'] in ['bill']:
-                    continue
-                doc, text = process(row)
-
-                document_file.write(doc.json() + "\n")
-                text_batch.append(text)
-                if len(text_batch) == 10000:
-                    write_batch(_dir, text_batch)
-                    text_batch = []
-    write_batch(_dir, text_batch)
-    text_batch = []
-            
+    _dir = Path('./data/documents')
+    if _dir.exists():
+       shutil.rmtree(_dir)
+    _dir.mkdir()
+
+    # Each row is processed independently, so the CPU-bound work is farmed out to a
+    # process pool, one memory-mapped byte range per task, while the main process only
+    # handles I/O. The workers inherit the court/jurisdiction dicts by importing this
+    # module.
+    with open('./data/document_records.jsonl', 'wb', buffering=1 << 20) as document_file, \
+         ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for doc_records, texts in executor.map(process_chunk, chunk_bounds(CORPUS_PATH), chunksize=1):
+            document_file.write(doc_records)
+
+            if texts:
+                write_batch(_dir, texts)
 
 
 
@@ -1,13 +1,10 @@
 import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Callable, Optional
 
-from pydantic import BaseModel
-from pydantic import Field
-from pydantic import AnyUrl
-from pydantic import validator
-from pydantic import AnyHttpUrl
-from dateutil import parser
+import msgspec
+
+encoder = msgspec.json.Encoder().encode
 
 
 class ChunkType(str, Enum):
@@ -27,74 +24,82 @@ class Instrument(Enum):
 # // NEW DATA MODEL //////////////////////////
 # ////////////////////////////////////////////
 
-class Document(BaseModel):
+# NOTE These models are `msgspec.Struct`s rather than Pydantic models as per-row Pydantic
+# validation and `.json()` serialisation dominated the cost of converting the corpus.
+# Dates are expected to have already been parsed into `datetime` objects upstream and urls
+# are kept as strings (they are already strings in the input).
+
+class Document(msgspec.Struct):
     id: str
     jurisdiction_id: str
-    court_id: Optional[str] = None
 
     instrument: Instrument
-    instrument_subtype: Optional[str] = None
 
     title: str
-    summary: Optional[str]
-    headnotes: Optional[str]
-    history: Optional[str]
-    disposition: Optional[str]
-
-    source_url: AnyUrl
-    html_url: Optional[AnyUrl]
-    pdf_url: Optional[AnyUrl]
-    xml_url: Optional[AnyUrl]
-    docx_url: Optional[AnyUrl]
-    rtf_url: Optional[AnyUrl]
-    pdf_path: Optional[str]
-
-    citation: Optional[str]
-    number: Optional[str]
-    year: Optional[int]
-
-    effective_date: Optional[datetime.date]
+
+    source_url: str
+
     date_scraped: datetime.datetime
-    other: Optional[dict] = None
 
-    @validator("effective_date", "date_scraped", pre=True)
-    def parse_datetime(cls, v):
-        if isinstance(v, str):
-            try:
-                v = parser.parse(v)
-            except (ValueError, TypeError):
-                pass
-        return v
+    court_id: Optional[str] = None
+    instrument_subtype: Optional[str] = None
+
+    summary: Optional[str] = None
+    headnotes: Optional[str] = None
+    history: Optional[str] = None
+    disposition: Optional[str] = None
+
+    html_url: Optional[str] = None
+    pdf_url: Optional[str] = None
+    xml_url: Optional[str] = None
+    docx_url: Optional[str] = None
+    rtf_url: Optional[str] = None
+    pdf_path: Optional[str] = None
+
+    citation: Optional[str] = None
+    number: Optional[str] = None
+    year: Optional[int] = None
 
-class DocumentSection(BaseModel):
+    effective_date: Optional[datetime.date] = None
+    other: Optional[dict] = None
+
+class DocumentSection(msgspec.Struct):
     id: str
     document_id: str
 
     text: str
-    
+
+    source_url: str
+
     title: Optional[str] = None
     citation: Optional[str] = None
     number: Optional[str] = None
 
-    source_url: AnyUrl
-    html_url: Optional[AnyUrl] = None
+    html_url: Optional[str] = None
 
     other: Optional[dict] = None
 
-class DocumentOpinion(BaseModel):
+class DocumentOpinion(msgspec.Struct):
     id: str
     document_id: str
 
     type: str
     text: str # some opinions are empty and you need to go to the download_url
-    author: Optional[str] = None
     per_curiam: bool
-    download_url: Optional[str] = None
     ocr: bool
     other: dict
+    author: Optional[str] = None
+    download_url: Optional[str] = None
 
-class DocumentMetadata(BaseModel):
+class DocumentMetadata(msgspec.Struct):
     document_id: str
+
+    instrument: Instrument
+
+    jurisdiction_id: str
+    jurisdiction: str
+    country: str
+
     document_title: Optional[str] = None  # will change when fixed legacy
     document_citation: Optional[str] = None
     document_source_url: Optional[str] = None
@@ -111,21 +116,21 @@ class DocumentMetadata(BaseModel):
 
     court: Optional[str] = None
 
-    instrument: Instrument
     instrument_subtype: Optional[str] = None
 
-    jurisdiction_id: str
-    jurisdiction: str
-    country: str
-    province: Optional[str]
+    province: Optional[str] = None
 
     other: Optional[dict] = None
     created_at: Optional[datetime.datetime] = None
 
-    class Config:
-        use_enum_values = True
-
-class DocumentText(BaseModel):
+class DocumentText(msgspec.Struct):
     id: str
     text: str
     metadata: DocumentMetadata
+
+# NOTE The encoder above never validates, which is what we want on the write side where the
+# data is trusted. These typed decoders are the validating slow path: reading a record back
+# through them type-checks every field, so they should be used during development and when
+# ingesting records produced elsewhere.
+document_decoder: Callable[[bytes], Document] = msgspec.json.Decoder(Document).decode
+document_text_decoder: Callable[[bytes], DocumentText] = msgspec.json.Decoder(DocumentText).decode
@@ -16,6 +16,7 @@ import aiohttp
 from msgspec import DecodeError
 from platformdirs import user_data_dir
 from rich.markdown import Markdown
+from alive_progress import alive_bar
 
 from .data import encoder, Entries, Request, entries_decoder, document_decoder, requests_decoder
 from .helpers import (log, console, warning, load_json, save_json, load_jsonl, save_jsonl, alive_gather,
@@ -77,6 +78,9 @@ class Creator:
         self.scrapers: dict[str, Scraper] = {scraper.source : scraper for scraper in self.scrapers}
         """A map of the names of sources to their scrapers."""
 
+        self.doc_workers: int = 30
+        """The number of workers used to retrieve missing documents concurrently."""
+
         # Initialise paths.
         cwd = os.getcwd()
         
@@ -297,12 +301,36 @@ class Creator:
             # Add missing documents to the Corpus.
             console.print('\nAdding documents to the Corpus.', style='light_cyan1 bold')
             
+            # Feed the missing documents through a pipeline of a bounded pool of retrieval workers and a single writer connected by queues. NOTE This caps the number of in-flight documents (retrieval of each document overlaps its fetching, parsing and OCR with that of the others) and avoids materialising one task per document upfront, which for millions of missing documents is prohibitively heavy.
             with open(self.corpus_path, 'ab') as f:
-                for doc in alive_as_completed([scraper.get_doc(entry) for scraper, entry in missing_entries]):
-                    doc = await doc
+                entry_queue = asyncio.Queue()
+
+                for scraper_entry in missing_entries:
+                    entry_queue.put_nowait(scraper_entry)
+
+                doc_queue = asyncio.Queue(maxsize=self.doc_workers * 2)
+
+                with alive_bar(len(missing_entries)) as bar:
+                    async def retrieve() -> None:
+                        while True:
+                            try:
+                                scraper, entry = entry_queue.get_nowait()
+
+                            except asyncio.QueueEmpty:
+                                return
+
+                            await doc_queue.put(await scraper.get_doc(entry))
+
+                    async def write() -> None:
+                        for _ in range(len(missing_entries)):
+                            doc = await doc_queue.get()
+
+                            if doc:
+                                f.write(encoder(doc))
+                                f.write(b'\n')
+
+                            bar()
 
-                    if doc:
-                        f.write(encoder(doc))
-                        f.write(b'\n')
+                    await asyncio.gather(write(), *[retrieve() for _ in range(self.doc_workers)])
             
             console.print('\nThe Corpus has been updated!', style='dark_cyan bold')
\ No newline at end of file
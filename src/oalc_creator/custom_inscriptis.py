@@ -11,6 +11,24 @@ from inscriptis.model.html_element import HtmlElement
 class CustomInscriptis(Inscriptis):
     """A custom Inscriptis parser for the Open Australian Legal Corpus."""
 
+    def __init__(self, html_tree, config = None, skip_classes: frozenset[str] = frozenset()) -> None:
+        # Store the classes of elements to be skipped before parsing as `Inscriptis.__init__` parses the tree. NOTE Skipping elements during the render walk fuses what would otherwise be two full traversals of the tree: one to `drop_tree` unwanted elements and another for Inscriptis to render the survivors.
+        self._skip_classes = skip_classes
+
+        super().__init__(html_tree, config)
+
+    def _parse_html_tree(self, state, tree):
+        # Skip elements with any of the skipped classes (and, by extension, their subtrees). The tail text is still written, mirroring the semantics of `drop_tree`, which joins the tail to the preceding element. NOTE The cheap existence check comes first and `isdisjoint` runs in C against the split tokens, avoiding the allocation of a temporary set per element.
+        if self._skip_classes and isinstance(tree.tag, str):
+            classes = tree.attrib.get('class')
+
+            if classes and not self._skip_classes.isdisjoint(classes.split()):
+                state.tags[-1].write(tree.tail)
+
+                return state.canvas
+
+        return super()._parse_html_tree(state, tree)
+
     # Override Inscriptis' default `ol` start tag handler so that lists start at the number provided in the `start` attribute of `ol` tags if such an attribute exists.
     def _start_ol(self, ol: dict) -> None:
         # Use the starting number provided in the `start` attribute if it exists, otherwise use 1.
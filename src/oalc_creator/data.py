@@ -4,7 +4,6 @@ import datetime
 from bs4 import BeautifulSoup
 from io import BytesIO
 from typing import Callable
-from functools import cached_property
 
 import orjson
 import msgspec
@@ -14,21 +13,26 @@ from frozndict import frozendict
 
 encoder = msgspec.json.Encoder().encode
 
+# A shared empty `frozendict` used as the default for request data and headers, avoiding a fresh allocation per request.
+_EMPTY = frozendict()
+
 class Request(msgspec.Struct, frozen = True):
-    """A request."""
+    """A request.
+
+    NOTE Callers passing `data` or `headers` should pass `frozendict`s rather than `dict`s, which spares requests constructed in tight loops the conversion below."""
 
     path: str
     method: str = 'get'
-    data: dict = frozendict()    # NOTE `frozendict` is used instead of `dict` to ensure that the request is hashable,
-    headers: dict = frozendict() # which is necessary to be able to place it in a set.
+    data: dict = _EMPTY
+    headers: dict = _EMPTY
     encoding: str = 'utf-8'
     selenium: bool = False
-    
+
     def __post_init__(self) -> None:
-        # Convert the data and headers to `frozendict` objects if they are not already.
+        # Convert `data` and `headers` into `frozendict`s if they are plain `dict`s to ensure that the request is hashable, which is necessary to be able to place it in a set. This is, in particular, the case when a request has been decoded from a cached index, as msgspec rebuilds the fields as `dict`s before invoking this hook. NOTE The `isinstance` checks keep construction with `frozendict`s (the common path) allocation-free.
         if not isinstance(self.data, frozendict):
             msgspec.structs.force_setattr(self, 'data', frozendict(self.data))
-        
+
         if not isinstance(self.headers, frozendict):
             msgspec.structs.force_setattr(self, 'headers', frozendict(self.headers))
 
@@ -45,42 +49,41 @@ class Request(msgspec.Struct, frozen = True):
 
 requests_decoder: Callable[[dict], set[Request]] = msgspec.json.Decoder(set[Request]).decode
 
-class Response(bytes):    
-    def __new__(cls, *args,
-                encoding: str,
-                type: str,
-                status: int,
-                **kwargs):
-        return super().__new__(cls, *args, **kwargs)
-
-    def __init__(self, *args,
-                encoding: str,
-                type: str,
-                status: int,
-                **kwargs):
-        """A response."""
-    
-        self.encoding = encoding
-        self.type = type
-        self.status = status
-        super().__init__()
+class Response(msgspec.Struct):
+    """A response.
+
+    NOTE A `msgspec.Struct` wrapping the response body is used rather than a subclass of `bytes` as structs are slotted, sparing every response the `__dict__` overhead of a `bytes` subclass."""
+
+    body: bytes
+    encoding: str
+    type: str | None = None
+    status: int | None = None
+    _text: str | None = None
+    _json: dict | None = None
 
-    @cached_property
+    @property
     def text(self) -> str:
-        return self.decode(self.encoding)
-    
+        # Decode the body on demand, memoising the result.
+        if self._text is None:
+            self._text = self.body.decode(self.encoding)
+
+        return self._text
+
     @property
     def html(self) -> BeautifulSoup:
         return BeautifulSoup(self.text, "lxml")
 
     @property
     def stream(self) -> BytesIO:
-        return BytesIO(self)
-    
-    @cached_property
+        return BytesIO(self.body)
+
+    @property
     def json(self) -> dict:
-        # NOTE It is necessary to convert the response to a `bytes` object before passing it to `orjson.loads()` as that function refuses to accept objects of the `Response` type despite the fact that `Response` is a subclass of `bytes`.
-        return orjson.loads(bytes(self))
+        # Decode the body on demand, memoising the result.
+        if self._json is None:
+            self._json = orjson.loads(self.body)
+
+        return self._json
 
 class Entry(msgspec.Struct, frozen = True):
     """An entry in a document index."""
@@ -144,6 +147,23 @@ class Section(msgspec.Struct, frozen = True):
     when_scraped: str
 
     
+# Precompiled patterns used by `format_citation`, `make_doc` and `make_section`, hoisted to module scope to avoid per-call lookups of the `re` cache.
+_TRAILING_NUMBER = re.compile(r' No\s+\d+$')
+_EXTRA_WHITESPACE = re.compile(r'\s+')
+_WORD_CHARS = re.compile(r'\w')
+
+# The local timezone, resolved once at import time as `astimezone()` without arguments performs a tzinfo lookup on every call.
+_LOCAL_TZ = datetime.datetime.now().astimezone().tzinfo
+
+def _has_min_word_chars(text: str, minimum: int = 9) -> bool:
+    """Check whether the text contains at least `minimum` word characters, exiting as soon as enough have been found rather than stripping a copy of the entire text."""
+
+    for i, _ in enumerate(_WORD_CHARS.finditer(text), start=1):
+        if i >= minimum:
+            return True
+
+    return False
+
 def format_citation(title: str, type: str, jurisdiction: str) -> str:
     """Format a citation."""
     
@@ -166,7 +186,7 @@ def format_citation(title: str, type: str, jurisdiction: str) -> str:
     # Format the citations of legislation.
     if type != 'decision':
         # If the title ends with 'No <number>', remove it.
-        title = re.sub(r' No\s+\d+$', '', title)
+        title = _TRAILING_NUMBER.sub('', title)
         
         # Determine which abbreviated jurisdiction to append to the title.
         if jurisdiction not in JURISDICTIONS:
@@ -181,7 +201,7 @@ def format_citation(title: str, type: str, jurisdiction: str) -> str:
         title = f'{title} ({abbreviated_jurisdiction})'
 
     # Remove extra whitespace characters.
-    title = re.sub(r'\s+', ' ', title)
+    title = _EXTRA_WHITESPACE.sub(' ', title)
     
     # Remove leading and trailing whitespace characters.
     title = ' '.join(title.split())
@@ -208,7 +228,7 @@ def make_doc(
     text = clean_text(text)
     
     # Return `None` if, when stripped of non-alphabetic characters, the text is less than 9 characters long.
-    if len(re.sub(r'\W', '', text)) < 9:
+    if not _has_min_word_chars(text):
         warning(f'The text of {url} was, when stripped of non-alphabetic characters, less than 9 characters long. The text extracted was "{text}". Returning `None`.')
         
         return
@@ -222,7 +242,7 @@ def make_doc(
         date = date,
         citation = citation,
         url = url,
-        when_scraped = datetime.datetime.now().astimezone().isoformat(),
+        when_scraped = datetime.datetime.now(_LOCAL_TZ).isoformat(),
         text = text,
     )
 
@@ -246,7 +266,7 @@ def make_section(
     text = clean_text(text)
     
     # Return `None` if, when stripped of non-alphabetic characters, the text is less than 9 characters long.
-    if len(re.sub(r'\W', '', text)) < 9:
+    if not _has_min_word_chars(text):
         warning(f'The text of {url} was, when stripped of non-alphabetic characters, less than 9 characters long. The text extracted was "{text}". Returning `None`.')
         return
 
@@ -259,7 +279,7 @@ def make_section(
         number=number,
         citation = citation,
         url = url,
-        when_scraped = datetime.datetime.now().astimezone().isoformat(),
+        when_scraped = datetime.datetime.now(_LOCAL_TZ).isoformat(),
         text = text,
     )
 
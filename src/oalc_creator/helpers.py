@@ -11,6 +11,7 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 import orjson
 import msgspec
+import lxml.etree
 
 from rich.console import Console
 from alive_progress import alive_bar
@@ -78,33 +79,24 @@ def load_jsonl(path: str, decoder: Callable[[bytes], Any] = orjson.loads) -> lis
 
 def save_jsonl(path: str, content: list, encoder: Callable[[Any], bytes] = msgspec.json.encode) -> None:
     """Save a list of objects as a jsonl file."""
-    
+
     with open(path, 'wb') as file:
-        for entry in content:
-            file.write(encoder(entry))
-            file.write(b'\n')
+        # Join the encoded entries into one buffer so the file is written with a single syscall rather than two writes per entry.
+        file.write(b''.join([encoder(entry) + b'\n' for entry in content]))
 
 async def alive_gather(*funcs):
     """`asyncio.gather` with a progress bar from `alive_progress`."""
-    
+
     # Initalise the progress bar.
     with alive_bar(len(funcs)) as bar:
-        # Create a wrapper function to update the progress bar and preserve the order of the results.
-        async def wrapper(i, func):
-            # Wait for the result.
-            res = await func
-            
-            # Update the progress bar.
-            bar()
-            
-            # Return the index and result.
-            return i, res
-        
-        # Wrap the functions and wait for the results.
-        res = [await func for func in asyncio.as_completed([wrapper(i, func) for i, func in enumerate(funcs)])]
-        
-        # Return the results sorted by index.
-        return [r for _, r in sorted(res)]
+        # Schedule the coroutines as tasks and update the progress bar as each completes. `gather` preserves the order of the results itself, so no wrapping, indexing or re-sorting is necessary.
+        tasks = [asyncio.ensure_future(func) for func in funcs]
+
+        for task in tasks:
+            task.add_done_callback(lambda _: bar())
+
+        # Wait for and return the results.
+        return await asyncio.gather(*tasks)
 
 def alive_as_completed(funcs):
     """`asyncio.as_completed` with a progress bar from `alive_progress`."""
@@ -140,36 +132,80 @@ def format_date(date: str) -> str:
     
     return datetime.strptime(date, '%d/%m/%Y').strftime('%Y-%m-%d')
 
+# Precompiled patterns used by `clean_text`, hoisted to module scope to avoid per-call lookups of the `re` cache.
+_WHITESPACE_LINES = re.compile(r'(?<=\n)\s*(?=\n)')
+_LEADING_WHITESPACE = re.compile(r'^\s*\n')
+_TRAILING_WHITESPACE = re.compile(r'\n\s*$')
+_LINE_END_WHITESPACE = re.compile(r'[ \t]+\n')
+
 def clean_text(text: str) -> str:
     """Clean text."""
-    
+
     # Replace non-breaking spaces with regular spaces.
     text = text.replace('\xa0', ' ')
 
     # Replace return carriages followed by newlines with newlines.
-    text = text.replace(r'\r\n', '\n')
+    text = text.replace('\r\n', '\n')
 
     # Remove whitespace from lines comprised entirely of whitespace.
-    text = re.sub(r'(?<=\n)\s*(?=\n)', '\n', text)
+    text = _WHITESPACE_LINES.sub('\n', text)
 
     # If the text begins with a newline or a newline preceded by whitespace, remove it and any preceding whitespace.
-    text = re.sub(r'^\s*\n', '', text)
+    text = _LEADING_WHITESPACE.sub('', text)
 
     # If the text ends with a newline or a newline succeeded by whitespace, remove it and any succeeding whitespace.
-    text = re.sub(r'\n\s*$', '', text)
+    text = _TRAILING_WHITESPACE.sub('', text)
 
     # Remove spaces and tabs from the ends of lines.
-    text = re.sub(r'[ \t]+\n', '\n', text)
-    
+    text = _LINE_END_WHITESPACE.sub('\n', text)
+
     return text
 
-def batch_generator(iterable: Iterable, batch_size: int) -> Generator[list, None, None]:
+def iter_html_links(body: bytes, prefix: str | tuple[str, ...], chunk_size: int = 65536) -> Generator[tuple[str, str], None, None]:
+    """Incrementally parse HTML and yield `(href, text)` pairs for anchors whose href begins with the provided prefix(es).
+
+    The body is fed to a pull parser in chunks and consumed anchors are cleared along with their preceding siblings, so link extraction never holds a full document tree in memory alongside the response body."""
+
+    parser = lxml.etree.HTMLPullParser(events=('end',), tag='a', recover=True)
+
+    def events() -> Generator[tuple[str, str], None, None]:
+        for _, elm in parser.read_events():
+            href = elm.get('href')
+
+            if href and href.startswith(prefix):
+                yield href, ''.join(elm.itertext())
+
+            # Clear the anchor and delete its preceding siblings to keep the partial tree flat.
+            elm.clear()
+
+            parent = elm.getparent()
+
+            if parent is not None:
+                while elm.getprevious() is not None:
+                    del parent[0]
+
+    for start in range(0, len(body), chunk_size):
+        parser.feed(body[start : start + chunk_size])
+
+        yield from events()
+
+    # Flush the parser and emit any remaining anchors.
+    with suppress(lxml.etree.XMLSyntaxError): # NOTE `close` raises on empty bodies.
+        parser.close()
+
+    yield from events()
+
+def batch_generator(iterable: Iterable, batch_size: int) -> Generator[tuple, None, None]:
     """Generate batches of the specified size from the provided iterable."""
-    
+
     iterator = iter(iterable)
-    
+
     for first in iterator:
-        yield list(itertools.chain([first], itertools.islice(iterator, batch_size - 1)))
+        yield (first, *itertools.islice(iterator, batch_size - 1))
+
+# Prefer the C-level `itertools.batched` on Python 3.12+, which avoids the per-batch Python-level tuple construction of the fallback above.
+if hasattr(itertools, 'batched'):
+    batch_generator = itertools.batched
 
 def get_browser(headless: bool = True):
     options = webdriver.ChromeOptions()
@@ -3,6 +3,7 @@ import re
 import asyncio
 import multiprocessing
 
+from typing import List
 from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor
 
@@ -11,46 +12,64 @@ import pytesseract
 
 from .helpers import batch_generator
 
+# Precompiled pattern for stripping paragraph numbers, hoisted to module scope so hot-path calls neither recompile nor hit the `re` cache.
+_PARAGRAPH_NUMBERS = re.compile(r'(^|\n)\d{1,4}[^\S\n]*\n')
 
-async def pdf2txt(
-    pdf: io.BytesIO,
+
+async def pdf2txt_batch(
+    pdfs: List[io.BytesIO],
     batch_size: int = None,
     thread_pool_executor: ThreadPoolExecutor = None,
     semaphore: asyncio.Semaphore = None,
     scale: int = 3,
-) -> str:
-    """OCR a PDF."""
-    
+) -> List[str]:
+    """OCR a batch of PDFs.
+
+    The pages of every PDF are flattened into shared batches submitted to a single persistent thread pool, so short PDFs do not leave executor threads idle and the semaphore is acquired once per batch rather than once per PDF."""
+
     # Initialise the thread pool executor if necessary.
     if thread_pool_executor is None:
         thread_pool_executor = ThreadPoolExecutor(multiprocessing.cpu_count() - 1 or 1)
-    
+
     # Set the batch size if necessary.
     if batch_size is None:
         batch_size = thread_pool_executor._max_workers
-    
-    # Load the PDF.
-    pdf = pypdfium2.PdfDocument(pdf)
-   
-    # OCR every page of the PDF in batches.
+
+    # Load the PDFs.
+    pdfs = [pypdfium2.PdfDocument(pdf) for pdf in pdfs]
+
+    # Flatten the pages of the PDFs, preserving the index of the PDF each page belongs to so that the text can be regrouped afterwards.
+    pages = ((i, pg) for i, pdf in enumerate(pdfs) for pg in pdf)
+
+    # OCR the pages of the PDFs in batches.
     # NOTE We use batching to avoid going OOM when we convert the pages into images and a sempahore to avoid going OOM when we OCR the images.
-    text = []
-    
+    texts = [[] for _ in pdfs]
+
     async with (semaphore or nullcontext()):
-        for pages in batch_generator(pdf, batch_size):
+        for batch in batch_generator(pages, batch_size):
                 # Convert the pages into images.
-                imgs = [pg.render(scale = scale).to_pil() for pg in pages]
-                
+                imgs = [pg.render(scale = scale).to_pil() for _, pg in batch]
+
                 # OCR the pages.
                 loop = asyncio.get_event_loop()
-                text.extend(await asyncio.gather(*[loop.run_in_executor(thread_pool_executor, pytesseract.image_to_string, img) for img in imgs]))
-                
+                page_texts = await asyncio.gather(*[loop.run_in_executor(thread_pool_executor, pytesseract.image_to_string, img) for img in imgs])
+
+                # Regroup the text of the pages by PDF.
+                for (i, _), page_text in zip(batch, page_texts):
+                    texts[i].append(page_text)
+
                 del imgs
 
-    # Join the text.
-    text = '\n'.join(text)
+    # Join the text of each PDF and remove paragraph numbers from it.
+    return [_PARAGRAPH_NUMBERS.sub('', '\n'.join(text)) for text in texts]
+
+async def pdf2txt(
+    pdf: io.BytesIO,
+    batch_size: int = None,
+    thread_pool_executor: ThreadPoolExecutor = None,
+    semaphore: asyncio.Semaphore = None,
+    scale: int = 3,
+) -> str:
+    """OCR a PDF."""
 
-    # Remove paragraph numbers from the text.
-    text = re.sub(r'(^|\n)\d{1,4}[^\S\n]*\n', '', text)
-    
-    return text
\ No newline at end of file
+    return (await pdf2txt_batch([pdf], batch_size, thread_pool_executor, semaphore, scale))[0]
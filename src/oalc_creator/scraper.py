@@ -1,14 +1,14 @@
 import random
 import asyncio
 import time
+import weakref
 import multiprocessing
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from contextlib import nullcontext
 from selenium import webdriver
 from concurrent.futures import ThreadPoolExecutor
-from typing import List
+from typing import Iterable, List
 
 import aiohttp
 import aiohttp.client_exceptions
@@ -16,6 +16,39 @@ import aiohttp.client_exceptions
 from .data import Entry, Request, Document, Section, Response
 from .helpers import log, get_browser
 
+# Lazily initialised defaults shared by every scraper that is not passed its own session or thread pool executor. A single session means a single connection pool, so TCP connections (and TLS handshakes) to the same hosts are reused across scrapers and across requests; a single thread pool prevents oversubscription between scrapers OCRing and parsing concurrently.
+_shared_sessions: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]' = weakref.WeakKeyDictionary()
+_shared_thread_pool_executor: ThreadPoolExecutor = None
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Lazily initialise and retrieve the `aiohttp` session shared by scrapers that were not passed their own. NOTE Sessions are keyed by the running event loop: a session is bound to the loop it was created under and must not be reused after that loop is torn down, as happens across successive `asyncio.run` calls (and separate async tests). The weak keying lets a dead loop's entry be collected with it. Each session lives as long as its loop and is never closed by the scrapers."""
+
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+
+    if session is None or session.closed:
+        session = _shared_sessions[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=30,
+            ),
+        )
+
+    return session
+
+def _get_shared_thread_pool_executor() -> ThreadPoolExecutor:
+    """Lazily initialise and retrieve the thread pool executor shared by scrapers that were not passed their own."""
+
+    global _shared_thread_pool_executor
+
+    if _shared_thread_pool_executor is None:
+        _shared_thread_pool_executor = ThreadPoolExecutor(multiprocessing.cpu_count() - 1 or 1)
+
+    return _shared_thread_pool_executor
+
 
 class Scraper(ABC):
     """A scraper."""
@@ -45,10 +78,10 @@ class Scraper(ABC):
             indices_refresh_interval (timedelta | bool, optional): The interval at which to refresh document indices or `True` if document indices must be refreshed. Defaults to 1 day.
             index_refresh_interval (timedelta | bool, optional): The interval at which to refresh the document index or `True` if the document index must be refreshed. Defaults to 1 day.
             semaphore (asyncio.Semaphore, optional): A semaphore for limiting the number of concurrent requests. Defaults to a semaphore with a limit of 30.
-            session (aiohttp.ClientSession, optional): An `aiohttp` session to use for making requests. Defaults to `None`, thereby creating a new session for every request.
+            session (aiohttp.ClientSession, optional): An `aiohttp` session to use for making requests. Defaults to `None`, thereby using the lazily initialised session shared by all scrapers.
             retry_exceptions (tuple[type[BaseException]], optional): A tuple of exceptions to retry on. Defaults to a tuple of `asyncio.TimeoutError`, `aiohttp.ClientConnectorError`, `aiohttp.client_exceptions.ServerDisconnectedError`, `aiohttp.client_exceptions.ClientOSError`, `aiohttp.client_exceptions.ClientPayloadError`, and `aiohttp.client_exceptions.ClientResponseError`.
             retry_statuses (tuple[int], optional): A tuple of statuses to retry on. Defaults to an empty tuple.
-            thread_pool_executor (ThreadPoolExecutor, optional): A thread pool executor for OCRing PDFs with `tesseract`. Defaults to a new thread pool executor with the same number of threads as the number of logical CPUs on the system minus one, or one if there is only one logical CPU.
+            thread_pool_executor (ThreadPoolExecutor, optional): A thread pool executor for OCRing PDFs with `tesseract`. Defaults to the lazily initialised thread pool executor shared by all scrapers, which has the same number of threads as the number of logical CPUs on the system minus one, or one if there is only one logical CPU.
             ocr_semaphore (asyncio.Semaphore, optional): A semaphore for limiting the number of PDFs that may be OCR'd concurrently. Defaults to a semaphore with a limit of 1."""
         
         self._browser = None
@@ -87,7 +120,7 @@ class Scraper(ABC):
         self.max_extra_jitter: int = 0.05
         """The maximum amount of extra jitter to add to the wait time even when the wait time has been capped."""
         
-        self.thread_pool_executor: ThreadPoolExecutor = thread_pool_executor or ThreadPoolExecutor(multiprocessing.cpu_count() - 1 or 1)
+        self.thread_pool_executor: ThreadPoolExecutor = thread_pool_executor or _get_shared_thread_pool_executor()
         """A thread pool executor for OCRing PDFs with `tesseract`."""
         
         self.ocr_semaphore: asyncio.Semaphore = ocr_semaphore or asyncio.Semaphore(1)
@@ -95,6 +128,9 @@ class Scraper(ABC):
         
         self.ocr_batch_size: int = self.thread_pool_executor._max_workers
         """The number of pages that may be OCR'd concurrently."""
+
+        self.entry_workers: int = 8
+        """The number of workers used to retrieve entries from a document index concurrently."""
             
     @abstractmethod
     async def get_index_reqs(self) -> set[Request]:
@@ -109,6 +145,32 @@ class Scraper(ABC):
     def _get_entry(self, *args, **kwargs) -> Entry | None:
         """Retrieve an entry from an element of a document index."""
         pass
+
+    async def _get_entries(self, paths_and_titles: Iterable[tuple], type: str) -> List[Entry | None]:
+        """Retrieve entries for the provided `(path, title)` pairs with a bounded pool of workers fed from a bounded queue, capping the number of simultaneous status-page requests rather than dispatching them all at once. NOTE `paths_and_titles` may be a lazy iterable: the producer blocks once the queue is full, so pairs are only drawn as workers make room and never all held in memory at once."""
+
+        queue = asyncio.Queue(maxsize=self.entry_workers * 2)
+
+        entries = []
+
+        async def produce() -> None:
+            for path_and_title in paths_and_titles:
+                await queue.put(path_and_title)
+
+            # Signal to each worker that the pairs have been exhausted.
+            for _ in range(self.entry_workers):
+                await queue.put(None)
+
+        async def worker() -> None:
+            while (path_and_title := await queue.get()) is not None:
+                path, title = path_and_title
+
+                entries.append(await self._get_entry(path, title, type))
+
+        # Spawn the producer and workers, and wait for the queue to be drained.
+        await asyncio.gather(produce(), *(worker() for _ in range(self.entry_workers)))
+
+        return entries
     
     @abstractmethod
     async def _get_doc(self, entry: Entry) -> Document | None:
@@ -225,10 +287,10 @@ class Scraper(ABC):
     
         while True:
             try:
-                # If `self.session` exists and has not been closed, use it. Otherwise, create a new session.
-                # NOTE We do not use `self.session` in a with statement but instead use a nullcontext (which acts as a flag for us to overwrite our session with `self.session`) in order to avoid closing `self.session` when it is not ours to close. The responsibility of closing `self.session` is on whoever passed it to the scraper.
-                async with self.semaphore, (nullcontext() if self.session and not self.session.closed else aiohttp.ClientSession()) as session:
-                    session = session or self.session # NOTE `session` will be `None` if our context manager is a nullcontext.
+                # If `self.session` exists and has not been closed, use it. Otherwise, fall back to the session shared by all scrapers rather than opening (and tearing down) a fresh session, connection pool and TLS handshake per request.
+                # NOTE Neither session is ours to close: the responsibility of closing `self.session` is on whoever passed it to the scraper, and the shared session lives for the remainder of the process.
+                async with self.semaphore:
+                    session = self.session if self.session and not self.session.closed else _get_shared_session()
                     async with session.request(**req.args) as response:
                         # Raise a custom `aiohttp.client_exceptions.ClientResponseError` exception if the response status code is in `self.retry_statuses`.
                         if response.status in self.retry_statuses:
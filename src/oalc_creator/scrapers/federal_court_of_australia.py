@@ -160,11 +160,11 @@ class FederalCourtOfAustralia(Scraper):
                 try:
                     # Try to decode the response as `windows-1250` (most judgements use this encoding).
                     try:
-                        resp = resp.decode('windows-1250')
+                        resp = resp.body.decode('windows-1250')
                     
                     # If a `UnicodeDecodeError` is encountered, try decoding the response as `cp1252` instead (this is also possible (see, eg, https://www.judgments.fedcourt.gov.au/judgments/Judgments/fca/single/2007/2007fca0517)).
                     except UnicodeDecodeError:
-                        resp = resp.decode('cp1252')
+                        resp = resp.body.decode('cp1252')
 
                 # If we are unable to decode the response, retrieve the DOCX version of the document instead.
                 except UnicodeDecodeError:
@@ -172,7 +172,7 @@ class FederalCourtOfAustralia(Scraper):
                     mime = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
                     
                     # Extract the url of the DOCX version of the document.
-                    url = re.search(rb'<a\s+href="([^"]+)"\s*>Original Word Document', resp).group(1).decode('cp1252')
+                    url = re.search(rb'<a\s+href="([^"]+)"\s*>Original Word Document', resp.body).group(1).decode('cp1252')
                     
                     # Retrieve the DOCX version of the document.
                     resp = await self.get(url)
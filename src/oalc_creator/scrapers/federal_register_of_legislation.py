@@ -16,7 +16,7 @@ from inscriptis.css_profiles import CSS_PROFILES
 from inscriptis.html_properties import Display, WhiteSpace
 from inscriptis.model.html_element import HtmlElement
 
-from ..ocr import pdf2txt
+from ..ocr import pdf2txt, pdf2txt_batch
 from ..data import Entry, Request, Document, make_doc, Response
 from ..helpers import log, warning
 from ..scraper import Scraper, ParseError
@@ -218,7 +218,7 @@ class FederalRegisterOfLegislation(Scraper):
             resps = await asyncio.gather(*[self.get(url) for url in urls])
             
             # Create etrees from the responses.
-            etrees = [lxml.html.document_fromstring(resp) for resp in resps]
+            etrees = [lxml.html.document_fromstring(resp.body) for resp in resps]
                 
             # Extract the text of the document's constituent parts.
             texts = [CustomInscriptis(etree, self._inscriptis_config).get_text() for etree in etrees]
@@ -306,7 +306,8 @@ class FederalRegisterOfLegislation(Scraper):
             if format == 'pdf':
                 # Extract the text of the document from its PDF parts.
                 try:
-                    texts = await asyncio.gather(*[pdf2txt(resp.stream, self.ocr_batch_size, self.thread_pool_executor, self.ocr_semaphore) for resp in part_resps])
+                    # NOTE The parts are OCR'd as a single batch so that their pages share executor batches and the OCR semaphore is acquired once for the whole document rather than once per part.
+                    texts = await pdf2txt_batch([resp.stream for resp in part_resps], self.ocr_batch_size, self.thread_pool_executor, self.ocr_semaphore)
                 
                 except PdfiumError as e:
                     # Log a warning.
@@ -142,7 +142,7 @@ class HighCourtOfAustralia(Scraper):
             resp = await self.get(url)
 
             # Return `None` if the document is missing.
-            if b'Document could not be found' in resp or b'There were no matching cases.' in resp:
+            if b'Document could not be found' in resp.body or b'There were no matching cases.' in resp.body:
                 warning(f"Unable to extract text from '{entry.request.path}' as it appears to be missing. Returning `None`.")
                 
                 return
@@ -2,9 +2,9 @@ import re
 import asyncio
 
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from concurrent.futures import ThreadPoolExecutor
 
-import pytz
 import aiohttp
 import lxml.html
 
@@ -14,10 +14,51 @@ from inscriptis.model.html_element import HtmlElement
 
 from ..ocr import pdf2txt
 from ..data import Entry, Request, Document, make_doc, Response
-from ..helpers import log, warning
+from ..helpers import log, warning, iter_html_links
 from ..scraper import Scraper
 from ..custom_inscriptis import CustomInscriptis, CustomParserConfig
 
+# Precompiled patterns, hoisted to module scope so hot-path calls neither recompile nor hit the `re` cache. NOTE `.*?` with `re.DOTALL` is used in place of the `(?:.|\n)*?` idiom, which forces the engine to retry the alternation per character.
+_PUBDATE_RE = re.compile(r'PublicationDate%3D(\d+)')
+_PUBDATE_META_RE = re.compile(rb'publication\.date="(\d{4}-\d{1,2}-\d{1,2})"', re.IGNORECASE) # NOTE A bytes pattern so that documents that turn out to be PDFs are never decoded.
+_PAGE_RE = re.compile(r'[?&]page=(\d+)')
+
+# The timezone of Queensland, hoisted to module scope as constructing a timezone involves a tz database lookup. NOTE `Australia/Brisbane` is the canonical IANA zone for Queensland ('Australia/Queensland' is not in the tz database).
+_TZ = ZoneInfo('Australia/Brisbane')
+
+# The classes of elements that are dropped from documents: footnotes and repealed text (they are both supposed to be hidden by Javascript) and links to the source of particular sections in the document (see, eg, https://www.legislation.qld.gov.au/view/whole/html/inforce/current/act-2023-019 'section 2(2)' which appears on the right side underneath the heading 'Schedule 1 Appropriations for 2023-2024').
+_DROP_CLASSES = frozenset({
+    'view-history-note', # Footnotes.
+    'view-repealed', # Repealed text.
+    'source', # Links to the source of particular sections in the document.
+})
+
+# The custom Inscriptis CSS profile and parser config, built once at import time: both are deterministic and immutable after construction, so there is no need to rebuild the profile's dozens of `HtmlElement` entries every time a scraper is instantiated.
+_INSCRIPTIS_PROFILE = CSS_PROFILES['strict'].copy()
+
+# Omit newlines before and after `p` elements.
+_INSCRIPTIS_PROFILE['p'] = HtmlElement(display=Display.block)
+
+# Ensure that whitespace is inserted before and after `span` elements to prevent words from sticking together (this was taken from the `relaxed` profile, however, we do not use that profile as it also pads `div`s).
+_INSCRIPTIS_PROFILE['span'] = HtmlElement(display=Display.inline, prefix=' ', suffix=' ', limit_whitespace_affixes=True)
+
+# Ensure that blockquotes are indented.
+_INSCRIPTIS_PROFILE['blockquote'] = HtmlElement(display=Display.block, padding_inline=4)
+
+_INSCRIPTIS_CONFIG = CustomParserConfig(_INSCRIPTIS_PROFILE)
+
+def _html_to_text(html: str, inscriptis_config: CustomParserConfig) -> str:
+    """Extract the text of a document from its HTML. NOTE This is a synchronous helper so that the CPU-bound parse and render can be run off the event loop in a thread pool (lxml releases the GIL while building and traversing trees)."""
+
+    # Create an etree from the response.
+    etree = lxml.html.fromstring(html)
+
+    # Select the element containing the text of the document.
+    text_elm = etree.xpath('//div[@id="fragview"]')[0]
+
+    # Extract the text of the document, skipping elements with any of the dropped classes during the render walk itself rather than traversing the subtree a second time just to `drop_tree` them beforehand.
+    return CustomInscriptis(text_elm, inscriptis_config, skip_classes=_DROP_CLASSES).get_text()
+
 
 class QueenslandCaselaw(Scraper):
     """A scraper for the Queensland Caselaw database."""
@@ -43,59 +84,51 @@ class QueenslandCaselaw(Scraper):
         self._jurisdiction = 'queensland'
         self._type = 'decision'
 
-        # Create a custom Inscriptis CSS profile.
-        inscriptis_profile = CSS_PROFILES['strict'].copy()
-
-        # Omit newlines before and after `p` elements.
-        inscriptis_profile['p'] = HtmlElement(display=Display.block)
-        
-        # Ensure that whitespace is inserted before and after `span` elements to prevent words from sticking together (this was taken from the `relaxed` profile, however, we do not use that profile as it also pads `div`s).
-        inscriptis_profile['span'] = HtmlElement(display=Display.inline, prefix=' ', suffix=' ', limit_whitespace_affixes=True)
-        
-        # Ensure that blockquotes are indented.
-        inscriptis_profile['blockquote'] = HtmlElement(display=Display.block, padding_inline=4)
-        
-        # Create an Inscriptis parser config using the custom CSS profile.
-        self._inscriptis_config = CustomParserConfig(inscriptis_profile)
+        # Use the Inscriptis parser config built at module scope.
+        self._inscriptis_config = _INSCRIPTIS_CONFIG
 
     @log
     async def get_index_reqs(self) -> set[Request]:
         # Get the current date in Queensland.
-        pit = datetime.now(tz=pytz.timezone("Australia/Queensland")).strftime(r"%d/%m/%Y")
+        pit = datetime.now(tz=_TZ).strftime(r"%d/%m/%Y")
         url = 'https://www.queenslandjudgments.com.au/caselaw'
         
-        resp = await self.get(Request(url, selenium=True))
-        html = resp.html
-        print(html)
-        el = resp.html.find('.pagination a')
-        print(el)
-        if not el:
-            print(el)
+        # Retrieve the first page of the index. NOTE The pagination links are present in the static HTML, so a plain request suffices and the Selenium render (a headless browser plus a fixed five-second sleep) is unnecessary.
+        resp = await self.get(Request(url))
+
+        # Create an etree from the response and select the pagination links.
+        etree = lxml.html.fromstring(resp.text)
+        anchors = etree.xpath('//*[contains(concat(" ", normalize-space(@class), " "), " pagination ")]//a')
+
+        # Extract the page numbers from the links' hrefs.
+        pages = [int(match.group(1)) for anchor in anchors if (match := _PAGE_RE.search(anchor.get('href', '')))]
+
+        if not pages:
+            # Log a warning with a capped snippet of the response to aid debugging without dumping the entire page to the console.
+            warning(f'Unable to find the pagination element at {url}. The response began: {resp.text[:512]!r}')
+
             raise ValueError('Unable to find pagination element.')
-        pagination_text = el[0].text_content()
-        numbers = re.findall(r'\d+', pagination_text)
-        highest_number = max(map(int, numbers))
+
+        highest_number = max(pages)
         return {
             Request(f'https://www.queenslandjudgments.com.au/caselaw?page={i}') for i in range(1, highest_number + 1)
         }
 
     @log
     async def get_index(self, req: Request) -> set[Entry]:
-        # Determine the document type of the index.
-        table = re.search(r'https://www.queenslandjudgments.com.au/caselaw?page=685', req.path).group(1)
-        
+        # Determine the document type of the index. NOTE This scraper only indexes decisions.
         type = 'decision'
-                
+
         # Retrieve the index.
-        resp = (await self.get(req)).text
-        
-        # Extract document paths and titles from the index.
-        paths_and_titles = re.findall(r'<a(?: class="indent")? href="/view/([^"]+)">((?:.|\n)*?)</a>', resp)
-        rows = re.findall(r"<tr\s*>((?:.|\n)*?)</tr>", resp)
+        resp = await self.get(req)
 
-        
-        # Create entries from the paths and titles.
-        return set(await asyncio.gather(*[self._get_entry(path, title, type) for path, title in paths_and_titles]))
+        # Extract document paths and titles by pull-parsing the index incrementally, never holding a full document tree alongside the response body. NOTE A generator expression is used so that the pairs flow straight into the worker queue without first being materialised as a list.
+        paths_and_titles = ((href.split('/view/', 1)[1], title) for href, title in iter_html_links(resp.body, '/view/'))
+
+        # Create entries from the paths and titles with a bounded pool of workers, deduplicating on version ids. NOTE Deduplicating via a dict keyed by version id hashes one string per entry, whereas `set` would recursively hash every field of the frozen structs, including their nested requests.
+        entries = {entry.version_id: entry for entry in await self._get_entries(paths_and_titles, type)}
+
+        return set(entries.values())
     
     @log
     async def _get_entry(self, path: str, title: str, type: str) -> Entry:
@@ -103,10 +136,8 @@ class QueenslandCaselaw(Scraper):
         
         # If the document is a bill then we already have its version id.
         if type == 'bill':
-            version_id = path
-            
-            # Remove 'html/' and 'pdf/' from the version id.
-            version_id = version_id.replace('html/', '').replace('pdf/', '')
+            # Strip a leading 'html/' or 'pdf/' from the path to produce the version id. NOTE A tuple `startswith` check bounded to the prefix replaces the two full scans (and up to two string copies) of the previous chained `replace` calls.
+            version_id = path.split('/', 1)[1] if path.startswith(('html/', 'pdf/')) else path
         
         # Otherwise, we must retrieve the document's status page to determine the id of its latest version.
         else:
@@ -117,7 +148,7 @@ class QueenslandCaselaw(Scraper):
             resp = (await self.get(f"https://www.queenslandjudgments.com.au/caselaw/{doc_id}")).text 
 
             # Extract the point in time of the latest version of the document.
-            pit = re.search(r'PublicationDate%3D(\d+)', resp).group(1)
+            pit = _PUBDATE_RE.search(resp).group(1)
             pit = f'{pit[:4]}-{pit[4:6]}-{pit[6:8]}'
             date = pit
 
@@ -144,8 +175,8 @@ class QueenslandCaselaw(Scraper):
         resp: Response = await self.get(entry.request)
         
         # Try extracting the date if its not available.
-        if not date and (match := re.search(r'publication.date="(\d{4}-\d{1,2}-\d{1,2})"', resp.text, flags=re.IGNORECASE)):
-            date = match.group(1)
+        if not date and (match := _PUBDATE_META_RE.search(resp.body)):
+            date = match.group(1).decode()
         
         # If error 404 is encountered, return `None`.
         if resp.status == 404:
@@ -153,8 +184,19 @@ class QueenslandCaselaw(Scraper):
             
             return
 
-        # If the document does not contain '<span id="view-whole">' then we know that it was extracted from a PDF and so we download the PDF and extract the text from it directly.
-        if '<span id="view-whole">' not in resp.text:
+        # If the server returned the PDF itself, OCR the body we already have: the `Content-Type` check is O(1) and short-circuits both the substring scan below and the second round trip of the re-fetch branch.
+        if resp.type == 'application/pdf':
+            # Store the document's url.
+            url = entry.request.path
+
+            # Extract the text of the document from the PDF with OCR.
+            text = await pdf2txt(resp.stream, self.ocr_batch_size, self.thread_pool_executor, self.ocr_semaphore)
+
+            # Store the mime of the document.
+            mime = 'application/pdf'
+
+        # If the document does not contain '<span id="view-whole">' then we know that it was extracted from a PDF and so we download the PDF and extract the text from it directly. NOTE The raw bytes are probed so that the response is not decoded just to answer the check.
+        elif b'<span id="view-whole">' not in resp.body:
             # Update the url.
             url = entry.request.path.replace('html', 'pdf')
             
@@ -170,29 +212,10 @@ class QueenslandCaselaw(Scraper):
         else:
             # Store the document's url.
             url = entry.request.path
-        
-            # Create an etree from the response.
-            etree = lxml.html.fromstring(resp.text)
-            
-            # Select the element containing the text of the document.
-            text_elm = etree.xpath('//div[@id="fragview"]')[0]
-
-            # Iterate over all elements with a `class` attribute.
-            for elm in text_elm.xpath('//*[@class]'):
-                # Retrieve the element's classes as a set.
-                classes = set(elm.get('class', '').split(' '))
-                
-                # Remove footnotes, repealed text (they are both supposed to be hidden by Javascript) and links to the source of particular sections in the document (see, eg, https://www.legislation.qld.gov.au/view/whole/html/inforce/current/act-2023-019 'section 2(2)' which appears on the right side underneath the heading 'Schedule 1 Appropriations for 2023-2024').
-                if classes & {
-                    'view-history-note', # Footnotes.
-                    'view-repealed', # Repealed text.
-                    'source', # Links to the source of particular sections in the document.
-                }:
-                    elm.drop_tree()
-
-            # Extract the text of the document.
-            text = CustomInscriptis(text_elm, self._inscriptis_config).get_text()
-            
+
+            # Extract the text of the document off the event loop so that the CPU-bound parse and render do not block every other scraper coroutine.
+            text = await asyncio.get_running_loop().run_in_executor(self.thread_pool_executor, _html_to_text, resp.text, self._inscriptis_config)
+
             # Store the mime of the document.
             mime = 'text/html'
         
@@ -129,7 +129,7 @@ class SouthAustralianLegislation(Scraper):
         date = entry.date
         
         if not date:
-            date_str = re.search(rb'Version: (\d{1,2}\.\d{1,2}\.\d{4})', resp)
+            date_str = re.search(rb'Version: (\d{1,2}\.\d{1,2}\.\d{4})', resp.body)
             
             if date_str:
                 date = date_str.group(1).decode('cp1252')
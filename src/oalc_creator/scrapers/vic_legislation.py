@@ -2,11 +2,12 @@ import re
 import asyncio
 
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from concurrent.futures import ThreadPoolExecutor
 
-import pytz
 import aiohttp
 import lxml.html
+import lxml.etree
 from typing import List
 
 from inscriptis.css_profiles import CSS_PROFILES
@@ -15,12 +16,52 @@ from inscriptis.model.html_element import HtmlElement
 
 from ..ocr import pdf2txt
 from ..data import Entry, Request, Document, make_doc, Section, make_section, Response
-from ..helpers import log, warning
+from ..helpers import log, warning, iter_html_links
 from ..scraper import Scraper
 from ..custom_inscriptis import CustomInscriptis, CustomParserConfig
 
 BASE_URL = "https://www.legislation.vic.gov.au"
 
+# Precompiled patterns, hoisted to module scope so hot-path calls neither recompile nor hit the `re` cache.
+_PIT_RE = re.compile(r'<a\s+href="/search\?pointInTime=(\d{4}-\d{2}-\d{2})&')
+
+# The timezone of Victoria, hoisted to module scope as constructing a timezone involves a tz database lookup. NOTE `Australia/Melbourne` is the canonical IANA zone for Victoria ('Australia/VIC', used previously, is not in the tz database and raised on lookup).
+_TZ = ZoneInfo('Australia/Melbourne')
+
+# Precompiled XPath selectors for the elements dropped from documents. `lxml.etree.XPath` compiles the expression once, whereas `Element.xpath` recompiles (or at best consults lxml's cache for) the string on every call. NOTE The selectors are relative (`.//`) rather than absolute (`//`), which would re-scan the entire document instead of the selected subtree.
+_TOOLBAR_XP = lxml.etree.XPath('.//div[@id="fragToolbar"]')
+_NAV_RESULT_XP = lxml.etree.XPath('.//div[@class="nav-result display-none"]')
+
+# The classes of elements that are skipped during text extraction: footnotes (they are supposed to be hidden by Javascript).
+_DROP_CLASSES = frozenset({'view-history-note'})
+
+# The custom Inscriptis CSS profile and parser config, built once at import time: both are deterministic and immutable after construction, so there is no need to rebuild the profile's dozens of `HtmlElement` entries every time a scraper is instantiated.
+_INSCRIPTIS_PROFILE = CSS_PROFILES['strict'].copy()
+
+# Ensure that blockquotes are indented.
+_INSCRIPTIS_PROFILE['blockquote'] = HtmlElement(display=Display.block, padding_inline=4)
+
+_INSCRIPTIS_CONFIG = CustomParserConfig(_INSCRIPTIS_PROFILE)
+
+def _html_to_text(html: str, inscriptis_config: CustomParserConfig) -> str:
+    """Extract the text of a document from its HTML. NOTE This is a synchronous helper so that the CPU-bound parse and render can be run off the event loop in a thread pool (lxml releases the GIL while building and traversing trees)."""
+
+    # Create an etree from the response.
+    etree = lxml.html.fromstring(html)
+
+    # Select the element containing the text of the document.
+    text_elm = etree.xpath('//div[@id="frag-col"]')[0]
+
+    # Remove the toolbar.
+    _TOOLBAR_XP(text_elm)[0].drop_tree()
+
+    # Remove the search results (they are supposed to be hidden by Javascript).
+    _NAV_RESULT_XP(text_elm)[0].drop_tree()
+
+    # Extract the text of the document, skipping footnotes during the render walk itself rather than traversing the subtree a second time just to `drop_tree` them beforehand. NOTE The toolbar and search results above are single elements located by compiled selectors, so they stay as cheap point deletions.
+    return CustomInscriptis(text_elm, inscriptis_config, skip_classes=_DROP_CLASSES).get_text()
+
+
 class VicLegislation(Scraper):
     """A scraper for the VIC Legislation database."""
     
@@ -43,20 +84,14 @@ class VicLegislation(Scraper):
         )
 
         self._jurisdiction = 'victoria'
-        
-        # Create a custom Inscriptis CSS profile.
-        inscriptis_profile = CSS_PROFILES['strict'].copy()
-        
-        # Ensure that blockquotes are indented.
-        inscriptis_profile['blockquote'] = HtmlElement(display=Display.block, padding_inline=4)
-        
-        # Create an Inscriptis parser config using the custom CSS profile.
-        self._inscriptis_config = CustomParserConfig(inscriptis_profile)
+
+        # Use the Inscriptis parser config built at module scope.
+        self._inscriptis_config = _INSCRIPTIS_CONFIG
 
     @log
     async def get_index_reqs(self) -> set[Request]:
         # Get the current date in NSW.
-        pit = datetime.now(tz=pytz.timezone("Australia/VIC")).strftime(r"%d/%m/%Y")
+        pit = datetime.now(tz=_TZ).strftime(r"%d/%m/%Y")
         
         return {
             Request(f'{BASE_URL}/in-force/{instrument}?page={0}')
@@ -71,19 +106,16 @@ class VicLegislation(Scraper):
 
         
         # Retrieve the index.
-        resp = (await self.get(req)).text
-        
-        # Extract document paths and titles from the index.
-        paths_and_titles = re.findall(r'<a(?: class="indent")? href="/view/(?:html|pdf)/([^"]+)">((?:.|\n)*?)</a>', resp)
-        
-        # Create entries from the paths and titles.
-        entries = await asyncio.gather(*[self._get_entry(path, title, type) for path, title in paths_and_titles])
-        
-        # Filter out entries that are `None`.
-        # NOTE It is possible for some documents to simply be missing which is why we filter out `s` rather than raising an exception.
-        entries = {entry for entry in entries if entry}
+        resp = await self.get(req)
+
+        # Extract document paths and titles by pull-parsing the index incrementally, never holding a full document tree alongside the response body. NOTE A generator expression is used so that the pairs flow straight into the worker queue without first being materialised as a list.
+        paths_and_titles = ((href.split('/', 3)[3], title) for href, title in iter_html_links(resp.body, ('/view/html/', '/view/pdf/')))
         
-        return entries
+        # Create entries from the paths and titles with a bounded pool of workers, filtering out entries that are `None` and deduplicating on version ids in a single pass.
+        # NOTE It is possible for some documents to simply be missing which is why `None`s are filtered out rather than raising an exception. Deduplicating via a dict keyed by version id hashes one string per entry, whereas `set` would recursively hash every field of the frozen structs, including their nested requests.
+        entries = {entry.version_id: entry for entry in await self._get_entries(paths_and_titles, type) if entry}
+
+        return set(entries.values())
     
     @log
     async def _get_entry(self, path: str, title: str, type: str) -> Entry | None:
@@ -111,12 +143,12 @@ class VicLegislation(Scraper):
             match resp.type:
                 case 'text/html':
                     # Extract the point in time of the latest version of the document.
-                    pit = re.search(r'<a\s+href="/search\?pointInTime=(\d{4}-\d{2}-\d{2})&', resp.text).group(1)
+                    pit = _PIT_RE.search(resp.text).group(1)
                     date = pit
                 
                 # If a PDF version of the document is returned, then we must use the current point in time.
                 case 'application/pdf':
-                    pit = datetime.now(tz=pytz.timezone("Australia/VIC")).strftime(r"%Y-%m-%d")
+                    pit = datetime.now(tz=_TZ).strftime(r"%Y-%m-%d")
                 
                 case _:
                     raise ValueError(f"Unable to retrieve entry from https://legislation.nsw.gov.au/view/html/inforce/current/{doc_id}. Invalid content type: {resp.type}.")
@@ -149,28 +181,13 @@ class VicLegislation(Scraper):
         
         match resp.type:
             case 'text/html':
-                # If the response contains the substring 'No fragments found.', then return `None` as there is a bug in the NSW Legislation database preventing the retrieval of certain documents (see, eg, https://legislation.nsw.gov.au/view/whole/html/inforce/2021-03-25/act-1944-031).
-                if 'No fragments found.' in resp.text:
+                # If the response contains the substring 'No fragments found.', then return `None` as there is a bug in the NSW Legislation database preventing the retrieval of certain documents (see, eg, https://legislation.nsw.gov.au/view/whole/html/inforce/2021-03-25/act-1944-031). NOTE Only the head of the raw bytes is probed as the marker appears in a top-of-document error template, avoiding a full decode and scan on the common path.
+                if b'No fragments found.' in resp.body[:8192]:
                     warning(f"Unable to retrieve document from {entry.request.path}. 'No fragments found.' encountered in the response, indicating that the document is missing from the NSW Legislation database. Returning `None`.")
                     return
                 
-                # Create an etree from the response.
-                etree = lxml.html.fromstring(resp.text)
-                
-                # Select the element containing the text of the document.
-                text_elm = etree.xpath('//div[@id="frag-col"]')[0]
-                
-                # Remove the toolbar.
-                text_elm.xpath('//div[@id="fragToolbar"]')[0].drop_tree()
-                
-                # Remove the search results (they are supposed to be hidden by Javascript).
-                text_elm.xpath('//div[@class="nav-result display-none"]')[0].drop_tree()
-
-                # Remove footnotes (they are supposed to be hidden by Javascript).
-                for elm in text_elm.xpath("//*[contains(concat(' ', normalize-space(@class), ' '), ' view-history-note ')]"): elm.drop_tree()
-
-                # Extract the text of the document.
-                text = CustomInscriptis(text_elm, self._inscriptis_config).get_text()
+                # Extract the text of the document off the event loop so that the CPU-bound parse and render do not block every other scraper coroutine.
+                text = await asyncio.get_running_loop().run_in_executor(self.thread_pool_executor, _html_to_text, resp.text, self._inscriptis_config)
             
             case 'application/pdf':
                 # Extract the text of the document from the PDF with OCR.